@@ -1,185 +1,441 @@
 # data_utils.py
+import itertools
+import os
 import re
+import sys
 import logging
-from typing import Dict, Any, List, Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import BinaryIO, Callable, Dict, Any, Final, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-_DTOK = {"UBYTE", "SBYTE", "UWORD", "SWORD", "ULONG", "SLONG", "FLOAT16_IEEE",
-         "FLOAT32_IEEE", "FLOAT64_IEEE", "DOUBLE", "U64", "S64"}
-
-_SYMLINK_RE = re.compile(r'"([^"]+)"')
+# The file is scanned as bytes; only values that end up in the result are decoded.
+_ENCODING: Final = "latin-1"
+_READ_CHUNK: Final = 1 << 20
+# Below this, starting worker processes costs more than it saves
+_PARALLEL_MIN_SIZE: Final = 16 << 20
+# Merging in the parent bounds the gain well before this; also keeps under
+# the 61-process limit of ProcessPoolExecutor on Windows
+_MAX_WORKERS: Final = 8
+
+_DTOK = {b"UBYTE", b"SBYTE", b"UWORD", b"SWORD", b"ULONG", b"SLONG", b"FLOAT16_IEEE",
+         b"FLOAT32_IEEE", b"FLOAT64_IEEE", b"DOUBLE", b"U64", b"S64"}
+# Shared str objects for values repeated on every item
+_INTERN_DTYPE = {t: sys.intern(t.decode("ascii")) for t in _DTOK}
+_TYPE_CHARACTERISTIC = sys.intern("Characteristic")
+_TYPE_MEASUREMENT = sys.intern("Measurement")
+_TYPE_MEASUREMENT_ARRAY = sys.intern("MeasurementArray")
+
+# Only these blocks are turned into records; the bodies of all others are skipped.
+_PARSED_BLOCKS: Final = frozenset({"CHARACTERISTIC", "MEASUREMENT", "MEASUREMENT_ARRAY"})
+
+# Directive scanning: plain prefix checks first, regex only for unusual spellings
+# (tabs after the keyword, ...). Directives are lower-case per ASAP2.
+_SLASH: Final = ord("/")
+_BEGIN_KW: Final = b"/begin"
+_END_KW: Final = b"/end"
+_BEGIN_PREFIX: Final = b"/begin "
+_END_PREFIX: Final = b"/end "
+_BEGIN_RE = re.compile(r'/begin\s+(\w+)\s+(\S+)(?:\s+"([^"]+)")?')
+_END_RE = re.compile(r'/end\s+(\w+)')
+
+
+@dataclass(slots=True)
+class ParamRecord:
+    """One parsed item; field names are the lower-cased GUI column names."""
+    type: str
+    name: str
+    comment: str
+    value: str = ""
+    data_type: str = ""
+    conversion: str = ""
+    measurement_params: str = ""
+    ecu_address: str = ""
+    symbol_link: str = ""
+    details: str = ""
+    module: str = ""  # second "_"-separated token of symbol_link; not a column
+
+
+# Searched besides the name; omit very large ones
+_SEARCH_FIELDS = ("comment", "symbol_link", "conversion", "data_type", "ecu_address", "measurement_params")
+_search_fields = attrgetter(*_SEARCH_FIELDS)
 
 
 def clean_text(text: Optional[str]) -> str:
     """Return a single-line, trimmed string (newline sequences -> space)."""
     if not text:
         return ""
-    return re.sub(r'(\r\n|\n|\r)', ' ', str(text)).strip()
-
-
-def _extract_symbol(line: str) -> str:
-    m = _SYMLINK_RE.search(line)
-    return m.group(1) if m else ""
-
-
-def parse_characteristic(name: str, desc: str, lines: List[str]) -> Dict[str, Any]:
+    # \r\n first so it collapses to one space, not two
+    return str(text).replace("\r\n", " ").replace("\r", " ").replace("\n", " ").strip()
+
+
+def _module_of(symbol: str) -> str:
+    return symbol.split("_", 2)[1] if "_" in symbol else ""
+
+
+def _extract_symbol(line: bytes) -> str:
+    """Return the first non-empty quoted token of a line."""
+    i = line.find(b'"')
+    while i != -1:
+        j = line.find(b'"', i + 1)
+        if j == -1:
+            break
+        if j > i + 1:
+            return line[i + 1:j].decode(_ENCODING)
+        i = j  # skip "" and retry from the closing quote
+    return ""
+
+
+def _is_word(tok: bytes) -> bool:
+    """Equivalent of a full ``\\w+`` match (ASCII only; others take the regex path)."""
+    return tok.replace(b"_", b"0").isalnum()
+
+
+def _match_begin(line: bytes) -> Optional[Tuple[str, str, str]]:
+    """Return (block, name, desc) for a ``/begin <BLOCK> <name> ["desc"]`` line."""
+    if line.startswith(_BEGIN_PREFIX):
+        parts = line[7:].split(None, 2)
+        if len(parts) > 1 and _is_word(parts[0]):
+            desc = b""
+            if len(parts) > 2 and parts[2].startswith(b'"'):
+                j = parts[2].find(b'"', 1)
+                if j > 1:
+                    desc = parts[2][1:j]
+            return parts[0].decode(_ENCODING), parts[1].decode(_ENCODING), desc.decode(_ENCODING)
+    elif not line.startswith(_BEGIN_KW):
+        return None
+    m = _BEGIN_RE.match(line.decode(_ENCODING))
+    if m:
+        return m.group(1), m.group(2), m.group(3) or ""
+    return None
+
+
+def _match_end(line: bytes) -> Optional[str]:
+    """Return the block keyword of an ``/end <BLOCK>`` line."""
+    if line.startswith(_END_PREFIX):
+        tok = line[5:].split(None, 1)[0]
+        if _is_word(tok):
+            return tok.decode(_ENCODING)
+    elif not line.startswith(_END_KW):
+        return None
+    m = _END_RE.match(line.decode(_ENCODING))
+    return m.group(1) if m else None
+
+
+def _iter_line_batches(f: BinaryIO) -> Iterator[List[bytes]]:
+    """Yield the lines of a binary file as one list per large chunk read.
+
+    Line splitting happens in C (``bytes.splitlines``); flattening the lists with
+    ``itertools.chain`` keeps the caller's per-line loop free of generator
+    round-trips. Like text mode, ``\\n``, ``\\r\\n`` and ``\\r`` all end a line; a
+    ``\\r\\n`` split across two chunks yields one extra empty line, which callers
+    skip anyway.
+    """
+    tail = b""
+    for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+        buf = tail + chunk
+        lines = buf.splitlines()
+        tail = lines.pop() if lines and buf[-1:] not in (b"\n", b"\r") else b""
+        yield lines
+    if tail:
+        yield [tail]
+
+
+def parse_characteristic(name: str, desc: str, lines: List[bytes]) -> ParamRecord:
     value = ""
     symbol = ""
     for line in lines:
-        if line.startswith("VALUE"):
+        if line.startswith(b"VALUE"):
             # VALUE <addr>
             parts = line.split()
             if len(parts) > 1:
-                value = parts[1]
-        elif line.startswith("SYMBOL_LINK"):
+                value = parts[1].decode(_ENCODING)
+        elif line.startswith(b"SYMBOL_LINK"):
             symbol = _extract_symbol(line)
 
-    return {
-        "Type": "Characteristic",
-        "Name": name,
-        "Comment": clean_text(desc),
-        "Value": value,
-        "Symbol_Link": symbol,
-    }
+    # Positional: keyword arguments make this call about twice as slow
+    # type, name, comment, value, data_type, conversion, measurement_params,
+    # ecu_address, symbol_link, details, module
+    return ParamRecord(_TYPE_CHARACTERISTIC, name, clean_text(desc), value,
+                       "", "", "", "", symbol, "", _module_of(symbol))
+
+
+def _first_token(rest: bytes) -> str:
+    return rest.split(None, 1)[0].decode(_ENCODING) if rest else ""
+
+
+def _on_dtype(head: bytes, rest: bytes, state: Dict[str, Any]) -> None:
+    # <DATATYPE> <conversion> <params...>
+    state["dtype"] = _INTERN_DTYPE[head]
+    toks = rest.split()
+    if toks:
+        state["conversion"] = toks[0].decode(_ENCODING)
+    if len(toks) > 1:
+        state["params"] = toks[1:]
+
+
+def _on_ecu_address(head: bytes, rest: bytes, state: Dict[str, Any]) -> None:
+    state["addr"] = _first_token(rest)
+
+
+def _on_array_size(head: bytes, rest: bytes, state: Dict[str, Any]) -> None:
+    state["array_size"] = _first_token(rest)
+
 
+def _on_symbol_link(head: bytes, rest: bytes, state: Dict[str, Any]) -> None:
+    state["symbol"] = _extract_symbol(rest)
 
-def _parse_measurement_like(name: str, desc: str, lines: List[str]) -> Dict[str, Any]:
+
+# First token of a MEASUREMENT body line -> handler
+_LINE_DISPATCH = {tok: _on_dtype for tok in _DTOK}
+_LINE_DISPATCH.update({
+    b"ECU_ADDRESS": _on_ecu_address,
+    b"ARRAY_SIZE": _on_array_size,
+    b"SYMBOL_LINK": _on_symbol_link,
+})
+
+
+def _parse_measurement_like(name: str, desc: str, lines: List[bytes]) -> ParamRecord:
     """Parse fields common to MEASUREMENT and array-typed MEASUREMENT."""
-    dtype = ""
-    conversion = ""
-    params: List[str] = []
-    addr = ""
-    symbol = ""
-    array_size = ""  # when present, this indicates an array measurement
+    state: Dict[str, Any] = {
+        "dtype": "",
+        "conversion": "",
+        "params": [],
+        "addr": "",
+        "symbol": "",
+        "array_size": "",  # when present, this indicates an array measurement
+    }
 
     for line in lines:
-        toks = line.split()
-        if toks and toks[0] in _DTOK:
-            dtype = toks[0]
-            if len(toks) > 1:
-                conversion = toks[1]
-            if len(toks) > 2:
-                params = toks[2:]
-        elif line.startswith("ECU_ADDRESS"):
-            parts = line.split()
-            addr = parts[1] if len(parts) > 1 else ""
-        elif line.startswith("ARRAY_SIZE"):
-            parts = line.split()
-            array_size = parts[1] if len(parts) > 1 else ""
-        elif line.startswith("SYMBOL_LINK"):
-            symbol = _extract_symbol(line)
+        toks = line.split(None, 1)
+        handler = _LINE_DISPATCH.get(toks[0])
+        if handler:
+            handler(toks[0], toks[1] if len(toks) > 1 else b"", state)
 
+    array_size = state["array_size"]
     # Measurement_Params: prefer explicit ARRAY_SIZE if present
-    meas_params = f"ARRAY_SIZE={array_size}" if array_size else " ".join(params)
-
-    base = {
-        "Name": name,
-        "Comment": clean_text(desc),
-        "Data_Type": dtype,
-        "Conversion": conversion,
-        "Measurement_Params": meas_params,
-        "ECU_Address": addr,
-        "Symbol_Link": symbol,
-    }
-
-    if array_size:
-        base["Type"] = "MeasurementArray"
-    else:
-        base["Type"] = "Measurement"
+    meas_params = f"ARRAY_SIZE={array_size}" if array_size else b" ".join(state["params"]).decode(_ENCODING)
 
-    return base
+    symbol = state["symbol"]
+    # Positional, in field order, as in parse_characteristic
+    return ParamRecord(_TYPE_MEASUREMENT_ARRAY if array_size else _TYPE_MEASUREMENT, name,
+                       clean_text(desc), "", state["dtype"], state["conversion"], meas_params,
+                       state["addr"], symbol, "", _module_of(symbol))
 
 
-def parse_measurement(name: str, desc: str, lines: List[str]) -> Dict[str, Any]:
+def parse_measurement(name: str, desc: str, lines: List[bytes]) -> ParamRecord:
     return _parse_measurement_like(name, desc, lines)
 
 
-def parse_measurement_array(name: str, desc: str, lines: List[str]) -> Dict[str, Any]:
+def parse_measurement_array(name: str, desc: str, lines: List[bytes]) -> ParamRecord:
     """Handle explicit MEASUREMENT_ARRAY blocks (rare)."""
     data = _parse_measurement_like(name, desc, lines)
-    data["Type"] = "MeasurementArray"
+    data.type = _TYPE_MEASUREMENT_ARRAY
     # Ensure ARRAY_SIZE shows in Measurement_Params even if missing in block
-    if "ARRAY_SIZE=" not in data.get("Measurement_Params", ""):
-        data["Measurement_Params"] = (data.get("Measurement_Params") + " ARRAY_SIZE=?").strip()
+    if "ARRAY_SIZE=" not in data.measurement_params:
+        data.measurement_params = (data.measurement_params + " ARRAY_SIZE=?").strip()
     return data
 
 
-def parse_a2l_file(filepath: str) -> Dict[str, Dict[str, Any]]:
-    """Parse a .a2l file into a dict keyed by block name."""
-    logger.info("Parsing A2L: %s", filepath)
+def _share_strings(det: ParamRecord, shared: Dict[str, str]) -> ParamRecord:
+    """Point fields that repeat across items at one str object per distinct value."""
+    det.conversion = shared.setdefault(det.conversion, det.conversion)
+    det.measurement_params = shared.setdefault(det.measurement_params, det.measurement_params)
+    det.module = shared.setdefault(det.module, det.module)
+    return det
 
-    begin_re = re.compile(r'/begin\s+(\w+)\s+([^\s]+)(?:\s+"([^"]+)")?', re.IGNORECASE)
-    end_re = re.compile(r'/end\s+(\w+)', re.IGNORECASE)
 
-    data: Dict[str, Dict[str, Any]] = {}
+def _parse_lines(raw_lines: Iterable[bytes]) -> Dict[str, ParamRecord]:
+    data: Dict[str, ParamRecord] = {}
+    shared: Dict[str, str] = {}  # flyweight table for _share_strings
+    det: Optional[ParamRecord]
     current = ""
+    collect = False  # current block is one we parse
     name = ""
     desc = ""
-    lines: List[str] = []
-
-    # A2L files are commonly ASCII/latin-1; utf-8 also works for simple content.
-    with open(filepath, encoding="latin-1") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line:
-                continue
-
-            m_begin = begin_re.match(line)
-            if m_begin:
-                current = m_begin.group(1).upper()
-                name = m_begin.group(2)
-                desc = m_begin.group(3) or ""
-                lines = []
-                continue
-
-            m_end = end_re.match(line)
-            if m_end and current:
-                block = m_end.group(1).upper()
-                if block == current:
-                    if block == "CHARACTERISTIC":
-                        data[name] = parse_characteristic(name, desc, lines)
-                    elif block == "MEASUREMENT":
-                        # Decide array vs scalar by presence of ARRAY_SIZE line
-                        is_array = any(l.strip().startswith("ARRAY_SIZE") for l in lines)
-                        if is_array:
-                            data[name] = parse_measurement_array(name, desc, lines)
-                        else:
-                            data[name] = parse_measurement(name, desc, lines)
-                    elif block == "MEASUREMENT_ARRAY":
-                        data[name] = parse_measurement_array(name, desc, lines)
-                current = ""
-                name = ""
-                desc = ""
-                lines = []
-                continue
-
-            if current:
+    lines: List[bytes] = []
+    has_array_size = False
+
+    for raw in raw_lines:
+        line = raw.strip()
+        if not line:
+            continue
+
+        # Only directives start with a slash; everything else is block content.
+        if line[0] != _SLASH:
+            if collect:
                 lines.append(line)
+                if line.startswith(b"ARRAY_SIZE"):
+                    has_array_size = True
+            continue
+
+        m_begin = _match_begin(line)
+        if m_begin:
+            current = m_begin[0].upper()
+            collect = current in _PARSED_BLOCKS
+            name = m_begin[1]
+            desc = m_begin[2]
+            lines = []
+            has_array_size = False
+            continue
+
+        block = _match_end(line)
+        if block and current:
+            block = block.upper()
+            if block == current:
+                det = None
+                if block == "CHARACTERISTIC":
+                    det = parse_characteristic(name, desc, lines)
+                elif block == "MEASUREMENT":
+                    # Decide array vs scalar by presence of ARRAY_SIZE line
+                    if has_array_size:
+                        det = parse_measurement_array(name, desc, lines)
+                    else:
+                        det = parse_measurement(name, desc, lines)
+                elif block == "MEASUREMENT_ARRAY":
+                    det = parse_measurement_array(name, desc, lines)
+                if det is not None:
+                    data[name] = _share_strings(det, shared)
+            current = ""
+            collect = False
+            name = ""
+            desc = ""
+            lines = []
+            has_array_size = False
+            continue
+
+        if collect:
+            lines.append(line)
+
+    return data
+
+
+def _split_offsets(filepath: str, parts: int) -> List[int]:
+    """Byte offsets cutting the file into up to ``parts`` ranges, each ending after an ``/end`` line.
+
+    ``_parse_lines`` is idle after every ``/end`` it recognizes, so the ranges parse
+    independently and give the same result as one pass over the whole file.
+    """
+    size = os.path.getsize(filepath)
+    offsets = [0]
+    with open(filepath, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, offsets[-1] + 1) - 1)
+            f.readline()  # finish the line the target falls into
+            for raw in iter(f.readline, b""):
+                line = raw.strip()
+                # A lone CR would make this more than one parser line; not a safe cut
+                if (line[:1] == b"/" and b"\r" not in raw.rstrip(b"\r\n")
+                        and _match_begin(line) is None and _match_end(line)):
+                    offsets.append(f.tell())
+                    break
+            else:
+                break
+    if offsets[-1] != size:
+        offsets.append(size)
+    return offsets
+
+
+# Records travel between processes as plain tuples; pickling them is far cheaper
+_RECORD_FIELDS: Final = tuple(f.name for f in fields(ParamRecord))
+_record_values = attrgetter(*_RECORD_FIELDS)
+
+
+def _parse_range(filepath: str, start: int, stop: int) -> List[Tuple[str, Tuple[str, ...]]]:
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        data = _parse_lines(f.read(stop - start).splitlines())
+    return [(name, _record_values(det)) for name, det in data.items()]
+
+
+def _parse_parallel(filepath: str, offsets: List[int], workers: int,
+                    progress: Optional[Callable[[int], None]] = None) -> Dict[str, ParamRecord]:
+    data: Dict[str, ParamRecord] = {}
+    # spawn rather than fork: callers (the GUI) may run this from a worker thread
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        parts = pool.map(_parse_range, itertools.repeat(filepath), offsets[:-1], offsets[1:])
+        # Merging in file order keeps first-seen order and last-wins values for duplicates
+        for i, part in enumerate(parts, 1):
+            for name, values in part:
+                data[name] = ParamRecord(*values)
+            if progress is not None:
+                progress(offsets[i] * 100 // offsets[-1])
+    return data
+
+
+def _report_progress(batches: Iterator[List[bytes]], f: BinaryIO, size: int,
+                     progress: Callable[[int], None]) -> Iterator[List[bytes]]:
+    for batch in batches:
+        progress(f.tell() * 100 // size)
+        yield batch
+
+
+def parse_a2l_file(filepath: str, workers: int = 1,
+                   progress: Optional[Callable[[int], None]] = None) -> Dict[str, ParamRecord]:
+    """Parse a .a2l file into a dict keyed by block name.
+
+    With ``workers`` > 1, files of at least ``_PARALLEL_MIN_SIZE`` bytes are split at
+    block boundaries and parsed in that many processes (at most ``_MAX_WORKERS``).
+    ``progress`` is called with the percentage of the file read so far.
+    """
+    logger.info("Parsing A2L: %s", filepath)
+
+    size = os.path.getsize(filepath)
+    workers = min(workers, _MAX_WORKERS)
+    offsets: List[int] = []
+    if workers > 1 and size >= _PARALLEL_MIN_SIZE:
+        offsets = _split_offsets(filepath, workers)
+    if len(offsets) > 2:
+        data = _parse_parallel(filepath, offsets, workers, progress)
+    else:
+        # A2L files are commonly ASCII/latin-1; utf-8 also works for simple content.
+        with open(filepath, "rb") as f:
+            batches = _iter_line_batches(f)
+            if progress is not None:
+                batches = _report_progress(batches, f, max(size, 1), progress)
+            data = _parse_lines(itertools.chain.from_iterable(batches))
 
     logger.info("Finished parsing; %d items", len(data))
     return data
 
 
-def load_data(path: str) -> Dict[str, Dict[str, Any]]:
+def load_data(path: str, workers: int = 1,
+              progress: Optional[Callable[[int], None]] = None) -> Dict[str, ParamRecord]:
     """Load data only from .a2l files."""
     if not path.lower().endswith(".a2l"):
         raise ValueError("Only .a2l files are supported")
-    return parse_a2l_file(path)
+    return parse_a2l_file(path, workers, progress)
 
 
-def search_parameters(data: Dict[str, Dict[str, Any]], query: str) -> Dict[str, Dict[str, Any]]:
+def build_search_index(data: Dict[str, ParamRecord]) -> Dict[str, str]:
+    """Map each name to one lower-cased string of all its searchable fields.
+
+    Fields are joined with ``\\x01`` so a query can never match across two fields.
+    """
+    return {
+        name: "\x01".join((name,) + _search_fields(det)).lower()
+        for name, det in data.items()
+    }
+
+
+def search_parameters(data: Dict[str, ParamRecord], query: str,
+                      index: Optional[Dict[str, str]] = None) -> Dict[str, ParamRecord]:
+    """Case-insensitive substring search over names and the fields in ``_SEARCH_FIELDS``.
+
+    Pass the result of ``build_search_index`` to avoid lower-casing on every call.
+    """
     q = query.lower()
-    out: Dict[str, Dict[str, Any]] = {}
-    for name, det in data.items():
-        if q in name.lower():
-            out[name] = det
-            continue
-        # Search important fields; omit very large ones
-        for key in ("Comment", "Symbol_Link", "Conversion", "Data_Type", "ECU_Address", "Measurement_Params"):
-            val = str(det.get(key, ""))
-            if val and q in val.lower():
-                out[name] = det
-                break
-    return out
+    if index is None:
+        index = build_search_index(data)
+    return {name: det for name, det in data.items() if q in index[name]}
+
+
+def search_keys(names: Iterable[str], query: str, index: Dict[str, str]) -> List[str]:
+    """Like ``search_parameters`` but over item names only, keeping their order."""
+    q = query.lower()
+    return [name for name in names if q in index[name]]
@@ -1,9 +1,14 @@
+import csv
 import os
 import sys
 import pandas as pd
 
-from typing import Dict, Any, Set, List
-from PySide6.QtCore import Qt, QPoint, QSettings, QTimer
+from collections import OrderedDict
+from operator import attrgetter, itemgetter
+from typing import Dict, Set, List, Optional, Tuple
+from PySide6.QtCore import (Qt, QPoint, QSettings, QTimer,
+                            QAbstractTableModel, QModelIndex,
+                            QObject, QRunnable, QThread, QThreadPool, Signal, Slot)
 from PySide6.QtGui import (QAction, QIcon, QPalette, 
                            QColor, QClipboard, QKeySequence, 
                            QGuiApplication)
@@ -12,12 +17,24 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, 
     QFileDialog, QMessageBox,
     QVBoxLayout, QLabel, QLineEdit, 
-    QComboBox, QTreeWidget, QTreeWidgetItem, 
-    QHeaderView, QStatusBar, QMenu, QToolBar
+    QComboBox, QTreeView, QAbstractItemView,
+    QHeaderView, QStatusBar, QMenu, QToolBar, QProgressBar
 )
 
 
-from data_utils import load_data, search_parameters
+from data_utils import ParamRecord, build_search_index, load_data, search_keys
+
+# xlsxwriter streams large sheets much faster than openpyxl; keep openpyxl as fallback
+try:
+    import xlsxwriter
+    EXCEL_ENGINE = "xlsxwriter"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+EXPORT_FILTERS = "Excel Files (*.xlsx);;CSV Files (*.csv)"
+SEARCH_CACHE_SIZE = 32
+# Names held by the search cache in total; about 8 bytes each
+SEARCH_CACHE_NAMES = 1_000_000
 
 APP_ORG = "CagriCatik"
 APP_NAME = "A2L-Wizard"
@@ -52,6 +69,190 @@ def apply_fusion_dark(app: QApplication, enabled: bool) -> None:
     palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
     app.setPalette(palette)
 
+class ParamTableModel(QAbstractTableModel):
+    """Flat table over pre-built row tuples; cells are only read when the view paints them.
+
+    Sorting is done here on the Python list. A QSortFilterProxyModel would call back
+    into data() for every comparison, which is far slower for large result sets.
+
+    Rows are handed to the view ``FETCH_BATCH`` at a time as it scrolls towards the end
+    (canFetchMore/fetchMore); QTreeView lays out every row it knows about on a reset.
+    """
+
+    FETCH_BATCH = 500
+
+    def __init__(self, columns: List[str], parent=None):
+        super().__init__(parent)
+        self._columns = columns
+        self._rows: List[Tuple[str, ...]] = []
+        self._loaded = 0  # rows exposed to the view so far
+        self._sort: Optional[tuple] = None
+
+    def set_rows(self, rows: List[Tuple[str, ...]]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(len(rows), self.FETCH_BATCH)
+        if self._sort:
+            self._sort_rows(*self._sort)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def fetch_all(self) -> None:
+        """Expose all remaining rows at once, e.g. before selecting every row."""
+        if self._loaded < len(self._rows):
+            self.beginInsertRows(QModelIndex(), self._loaded, len(self._rows) - 1)
+            self._loaded = len(self._rows)
+            self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            # Empty cells paint the same without converting "" to a QString
+            return self._rows[index.row()][index.column()] or None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._columns[section]
+        return None
+
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        if not 0 <= column < len(self._columns):
+            return
+        self._sort = (column, order)
+        if not self.persistentIndexList():
+            self.layoutAboutToBeChanged.emit()
+            self._sort_rows(column, order)
+            self.layoutChanged.emit()
+            return
+        # Sort a permutation so selection and current index follow their items
+        rows = self._rows
+        keys = [row[column] for row in rows]
+        perm = sorted(range(len(rows)), key=keys.__getitem__, reverse=order == Qt.DescendingOrder)
+        new_row = [0] * len(perm)
+        for new, old in enumerate(perm):
+            new_row[old] = new
+        # Fetch far enough that every selected item still has a row after the sort. The
+        # selection is only known as ranges here, so cover the span between them.
+        held = [index.row() for index in self.persistentIndexList()]
+        needed = max(new_row[min(held):max(held) + 1]) + 1
+        if needed > self._loaded:
+            self.beginInsertRows(QModelIndex(), self._loaded, needed - 1)
+            self._loaded = needed
+            self.endInsertRows()
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        self._rows = [rows[i] for i in perm]
+        self.changePersistentIndexList(
+            persistent, [self.index(new_row[index.row()], index.column()) for index in persistent])
+        self.layoutChanged.emit()
+
+    def _sort_rows(self, column: int, order) -> None:
+        # Stable, like QTreeWidget's sort, so ties keep their previous order
+        self._rows.sort(key=itemgetter(column), reverse=order == Qt.DescendingOrder)
+
+    def row_values(self, row: int) -> List[str]:
+        return list(self._rows[row])
+
+
+class ParamTreeView(QTreeView):
+    """QTreeView whose select-all (Ctrl+A) also covers rows not fetched yet."""
+
+    def selectAll(self) -> None:
+        model = self.model()
+        if isinstance(model, ParamTableModel):
+            model.fetch_all()
+        super().selectAll()
+
+
+def write_rows(path: str, columns: List[str], rows: List) -> None:
+    """Write a header and rows to ``path`` as CSV or Excel, chosen by the extension."""
+    if path.lower().endswith(".csv"):
+        # With a BOM, Excel reads the file as UTF-8 instead of the local code page
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(rows)
+    elif EXCEL_ENGINE == "xlsxwriter":
+        # constant_memory flushes each row to disk once the next one starts. That needs
+        # row-by-row writes, which pandas' to_excel (column by column) does not do.
+        with xlsxwriter.Workbook(path, {"constant_memory": True}) as wb:
+            ws = wb.add_worksheet()
+            # Same header look as pandas' to_excel
+            header = wb.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+            ws.write_row(0, 0, columns, header)
+            for r, row in enumerate(rows, 1):
+                ws.write_row(r, 0, row)
+    else:
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        df.to_excel(path, index=False, engine=EXCEL_ENGINE)
+
+
+class ExportSignals(QObject):
+    finished = Signal(str, int)  # path, row count
+    failed = Signal(str)
+
+
+class ExportWorker(QRunnable):
+    """Write rows to an Excel or CSV file (see ``write_rows``) on a pool thread."""
+
+    def __init__(self, rows: List, columns: List[str], path: str):
+        super().__init__()
+        self.rows = rows
+        self.columns = columns
+        self.path = path
+        self.signals = ExportSignals()
+
+    def run(self) -> None:
+        try:
+            write_rows(self.path, self.columns, self.rows)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.path, len(self.rows))
+
+
+class A2LLoader(QObject):
+    """Parse an .a2l file and build its search index; meant to run in a QThread."""
+
+    progress = Signal(int)  # percent of the file read
+    finished = Signal(str, object, object)  # path, param dict, search index
+    failed = Signal(str)
+
+    def __init__(self, path: str, workers: int = 1):
+        super().__init__()
+        self.path = path
+        self.workers = workers
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            data = load_data(self.path, workers=self.workers, progress=self.progress.emit)
+            index = build_search_index(data)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(self.path, data, index)
+
+
 class A2LSearchWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -63,12 +264,32 @@ class A2LSearchWindow(QMainWindow):
         apply_fusion_dark(QApplication.instance(), self.settings.value("ui/dark", False, type=bool))
 
         # Data fields
-        self.param_dict: Dict[str, Dict[str, Any]] = {}
-        self.last_results: Dict[str, Dict[str, Any]] = {}
+        self.param_dict: Dict[str, ParamRecord] = {}
+        self.last_results: Dict[str, ParamRecord] = {}
+        self._search_index: Dict[str, str] = {}
+        # Items per Type / per Module, rebuilt on load
+        self._by_type: Dict[str, Dict[str, ParamRecord]] = {}
+        self._by_module: Dict[str, Dict[str, ParamRecord]] = {}
         self.columns: List[str] = [
             "Type", "Name", "Comment", "Value", "Data_Type", "Conversion",
             "Measurement_Params", "ECU_Address", "Symbol_Link", "Details",
         ]
+        # Reads a ParamRecord's column values as one tuple, in column order
+        self._row_getter = attrgetter(*(c.lower() for c in self.columns))
+        # Display tuple per item in column order, built once per load
+        self._row_cache: Dict[str, Tuple[str, ...]] = {}
+        # Running load, if any
+        self._load_thread: Optional[QThread] = None
+        self._loader: Optional[A2LLoader] = None
+        # Running export, kept referenced until it reports back
+        self._export_worker: Optional[ExportWorker] = None
+        # Names of recent query results by (lower-cased query, type, module); cleared on load
+        self._search_cache: OrderedDict[Tuple[str, str, str], List[str]] = OrderedDict()
+        self._search_cache_names = 0
+        # Filters behind last_results, for narrowing while the query grows
+        self._last_q = ""
+        self._last_tf = ""
+        self._last_mf = ""
 
         # Window
         self.setWindowTitle("A2L Wizard")
@@ -77,6 +298,12 @@ class A2LSearchWindow(QMainWindow):
             self.setWindowIcon(QIcon(icon_path))
         self.resize(1400, 800)
 
+        # Debounced search timer; created before the widgets whose signals restart it
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(200)
+        self.search_timer.timeout.connect(self._do_search)
+
         # Build UI
         self._init_menu()
         self._init_toolbar()
@@ -85,21 +312,15 @@ class A2LSearchWindow(QMainWindow):
         # Restore state after widgets exist
         self._restore_state()
 
-        # Debounced search timer
-        self.search_timer = QTimer(self)
-        self.search_timer.setSingleShot(True)
-        self.search_timer.setInterval(200)
-        self.search_timer.timeout.connect(self._do_search)
-
     # ---------- UI ----------
     def _init_menu(self) -> None:
         menubar = self.menuBar()
 
         file_menu = menubar.addMenu("File")
-        act_open = QAction("Load .a2l File...", self)
-        act_open.setShortcut(QKeySequence.Open)
-        act_open.triggered.connect(self.load_file)
-        file_menu.addAction(act_open)
+        self.act_open = QAction("Load .a2l File...", self)
+        self.act_open.setShortcut(QKeySequence.Open)
+        self.act_open.triggered.connect(self.load_file)
+        file_menu.addAction(self.act_open)
 
         self.act_export = QAction("Export Filtered", self)
         self.act_export.setShortcut(QKeySequence("Ctrl+E"))
@@ -107,6 +328,14 @@ class A2LSearchWindow(QMainWindow):
         self.act_export.setEnabled(False)
         file_menu.addAction(self.act_export)
         file_menu.addSeparator()
+
+        # Off by default: starting the worker processes has not yet been shown to pay
+        # off on multi-core Windows machines
+        self.act_parallel = QAction("Parse Large Files in Parallel", self, checkable=True)
+        self.act_parallel.setChecked(self.settings.value("parse/parallel", False, type=bool))
+        self.act_parallel.toggled.connect(lambda on: self.settings.setValue("parse/parallel", on))
+        file_menu.addAction(self.act_parallel)
+        file_menu.addSeparator()
         file_menu.addAction("Exit", self.close)
 
         view_menu = menubar.addMenu("View")
@@ -134,13 +363,13 @@ class A2LSearchWindow(QMainWindow):
         tb.setMovable(False)
         self.addToolBar(Qt.TopToolBarArea, tb)
 
-        btn_open = QAction(QIcon.fromTheme("document-open"), "Load .a2l", self)
-        btn_open.triggered.connect(self.load_file)
-        tb.addAction(btn_open)
+        self.btn_open = QAction(QIcon.fromTheme("document-open"), "Load .a2l", self)
+        self.btn_open.triggered.connect(self.load_file)
+        tb.addAction(self.btn_open)
 
-        btn_export = QAction(QIcon.fromTheme("document-save"), "Export", self)
-        btn_export.triggered.connect(self.export_to_excel)
-        tb.addAction(btn_export)
+        self.btn_export = QAction(QIcon.fromTheme("document-save"), "Export", self)
+        self.btn_export.triggered.connect(self.export_to_excel)
+        tb.addAction(self.btn_export)
 
         tb.addSeparator()
 
@@ -172,14 +401,15 @@ class A2LSearchWindow(QMainWindow):
         self.setCentralWidget(central)
         layout = QVBoxLayout(central)
 
-        self.tree = QTreeWidget()
+        self.model = ParamTableModel(self.columns, self)
+        self.tree = ParamTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setRootIsDecorated(False)
         self.tree.setAlternatingRowColors(True)
         self.tree.setSortingEnabled(True)
         self.tree.setUniformRowHeights(True)
-        self.tree.setEditTriggers(QTreeWidget.NoEditTriggers)
-        self.tree.setSelectionMode(QTreeWidget.ExtendedSelection)
-        self.tree.setColumnCount(len(self.columns))
-        self.tree.setHeaderLabels(self.columns)
+        self.tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
 
         header = self.tree.header()
         header.setSortIndicatorShown(True)
@@ -196,6 +426,11 @@ class A2LSearchWindow(QMainWindow):
 
         self.status = QStatusBar()
         self.setStatusBar(self.status)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.hide()
+        self.status.addPermanentWidget(self.progress_bar)
         self.lbl_count = QLabel("0 displayed")
         self.status.addPermanentWidget(self.lbl_count)
 
@@ -234,7 +469,7 @@ class A2LSearchWindow(QMainWindow):
 
     def _apply_row_height(self, enabled: bool) -> None:
         compact = enabled if isinstance(enabled, bool) else self.act_compact.isChecked()
-        self.tree.setStyleSheet("QTreeWidget::item { height: %dpx; }" % (18 if compact else 24))
+        self.tree.setStyleSheet("QTreeView::item { height: %dpx; }" % (18 if compact else 24))
         self.settings.setValue("ui/compact", compact)
 
     def _reset_column_widths(self) -> None:
@@ -246,33 +481,79 @@ class A2LSearchWindow(QMainWindow):
 
     # ---------- Filters / parsing ----------
     def update_module_filter(self) -> None:
-        modules: Set[str] = set()
-        for det in self.param_dict.values():
-            link = det.get("Symbol_Link", "")
-            parts = link.split("_")
-            if len(parts) >= 2:
-                modules.add(parts[1])
+        modules: Set[str] = {det.module for det in self.param_dict.values() if det.module}
+
+        # An item belongs to every listed module that appears in its Symbol_Link
+        self._by_type = {}
+        self._by_module = {m: {} for m in modules}
+        for name, det in self.param_dict.items():
+            self._by_type.setdefault(det.type, {})[name] = det
+            if det.symbol_link:
+                for part in set(det.symbol_link.split("_")):
+                    bucket = self._by_module.get(part)
+                    if bucket is not None:
+                        bucket[name] = det
+
         self.module_combo.blockSignals(True)
         self.module_combo.clear()
-        self.module_combo.addItem("All")
-        for m in sorted(modules):
-            self.module_combo.addItem(m)
+        self.module_combo.addItems(["All", *sorted(modules)])
         self.module_combo.blockSignals(False)
 
     # ---------- File ops ----------
     def load_file(self) -> None:
         path, _ = QFileDialog.getOpenFileName(self, "Open .a2l File", "", "A2L Files (*.a2l)")
-        if not path:
+        if not path or self._load_thread is not None:
             return
+        # Parse in a worker thread so the window stays responsive on large files
+        workers = (os.cpu_count() or 1) if self.act_parallel.isChecked() else 1
+        self._loader = A2LLoader(path, workers)
+        self._load_thread = QThread(self)
+        self._loader.moveToThread(self._load_thread)
+        self._load_thread.started.connect(self._loader.run)
+        self._loader.progress.connect(self.progress_bar.setValue)
+        self._loader.finished.connect(self._on_loaded)
+        self._loader.failed.connect(self._on_load_failed)
+        self._loader.finished.connect(self._load_thread.quit)
+        self._loader.failed.connect(self._load_thread.quit)
+        self._load_thread.finished.connect(self._load_thread_done)
+
+        self.act_open.setEnabled(False)
+        self.btn_open.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.status.showMessage(f"Loading {os.path.basename(path)}...")
+        self._load_thread.start()
+
+    def _load_thread_done(self) -> None:
+        self._loader.deleteLater()
+        self._load_thread.deleteLater()
+        self._loader = None
+        self._load_thread = None
+        self.act_open.setEnabled(True)
+        self.btn_open.setEnabled(True)
+        self.progress_bar.hide()
+
+    def _on_load_failed(self, message: str) -> None:
+        self.status.clearMessage()
+        QMessageBox.critical(self, "Error", message)
+
+    def _on_loaded(self, path: str, data: Dict[str, ParamRecord], index: Dict[str, str]) -> None:
         try:
-            self.param_dict = load_data(path)
+            self.param_dict = data
+            self._search_index = index
+            row_getter = self._row_getter
+            self._row_cache = {name: row_getter(det) for name, det in self.param_dict.items()}
+            # Previous results belong to the old file
+            self._last_q = ""
+            self._search_cache.clear()
+            self._search_cache_names = 0
             self.file_label_text(os.path.basename(path))
             self.update_module_filter()
             self.search_input.clear()
             self.search_input.setFocus()
             self._do_search()
             self.status.showMessage(f"Loaded {len(self.param_dict)} items")
-            self.act_export.setEnabled(True)
+            self._update_export_actions()
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
@@ -280,56 +561,122 @@ class A2LSearchWindow(QMainWindow):
         if not self.last_results:
             QMessageBox.warning(self, "Export", "No data to export. Perform a search first.")
             return
-        path, _ = QFileDialog.getSaveFileName(self, "Save Filtered Data", "", "Excel Files (*.xlsx)")
+        path = self._ask_export_path("Save Filtered Data")
         if not path:
             return
-        try:
-            df = pd.DataFrame(list(self.last_results.values()))
-            df.to_excel(path, index=False)
-
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Exported {len(self.last_results)} items to:\n{path}"
-            )
-            self.status.showMessage(f"Exported {len(self.last_results)} items to {path}")
-
-            self.status.showMessage(f"Exported {len(self.last_results)} items to {path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", str(e))
+        cache = self._row_cache
+        rows = [cache[name] for name in self.last_results]
+        self._start_export(rows, path, self._export_finished)
+
+    def _ask_export_path(self, title: str) -> str:
+        path, selected = QFileDialog.getSaveFileName(self, title, "", EXPORT_FILTERS)
+        if path and not path.lower().endswith((".xlsx", ".csv")):
+            path += ".csv" if selected.startswith("CSV") else ".xlsx"
+        return path
+
+    def _start_export(self, rows: List, path: str, on_finished) -> None:
+        """Run the export on the global thread pool; export actions stay disabled until it ends."""
+        worker = ExportWorker(rows, self.columns, path)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(self._export_failed)
+        self._export_worker = worker
+        self._update_export_actions()
+        self.status.showMessage(f"Exporting {len(rows)} rows to {path}...")
+        QThreadPool.globalInstance().start(worker)
+
+    def _end_export(self) -> None:
+        self._export_worker = None
+        self._update_export_actions()
+
+    def _update_export_actions(self) -> None:
+        # Only one export at a time; a second would replace _export_worker mid-write
+        idle = self._export_worker is None
+        self.act_export.setEnabled(idle and bool(self.param_dict))
+        self.btn_export.setEnabled(idle)
+
+    def _export_finished(self, path: str, count: int) -> None:
+        self._end_export()
+        QMessageBox.information(
+            self,
+            "Export Successful",
+            f"Exported {count} items to:\n{path}"
+        )
+        self.status.showMessage(f"Exported {count} items to {path}")
+
+    def _selected_export_finished(self, path: str, count: int) -> None:
+        self._end_export()
+        self.status.showMessage(f"Exported {count} selected rows to {path}")
+
+    def _export_failed(self, message: str) -> None:
+        self._end_export()
+        self.status.clearMessage()
+        QMessageBox.critical(self, "Export Error", message)
 
     # ---------- Search ----------
     def _schedule_search(self) -> None:
         self.search_timer.start()
 
     def _do_search(self) -> None:
+        # A pending debounce would only repeat this search and reset the view again
+        self.search_timer.stop()
         q = self.search_input.text().strip()
         tf = self.type_combo.currentText()
         mf = self.module_combo.currentText()
-
-        results = self.param_dict
-        if tf != "All":
-            results = {n: d for n, d in results.items() if d.get("Type") == tf}
-        if mf != "All":
-            filtered: Dict[str, Dict[str, Any]] = {}
-            for n, d in results.items():
-                link = d.get("Symbol_Link", "")
-                parts = link.split("_") if link else []
-                if mf in parts:
-                    filtered[n] = d
-            results = filtered
-        if q:
-            results = search_parameters(results, q)
+        if not q and tf == "All" and mf == "All" and self.last_results is self.param_dict:
+            return  # everything is already shown; keep the view as it is
+
+        key = (q.lower(), tf, mf)
+        names = self._search_cache.get(key)
+        if names is not None:
+            self._search_cache.move_to_end(key)
+            records = self.param_dict
+            results = {n: records[n] for n in names}
+        else:
+            results = self._filter(q, tf, mf)
+            # Without a query the result is a bucket, or two intersected; cheap to redo
+            if q:
+                self._cache_results(key, list(results))
+        self._last_q, self._last_tf, self._last_mf = key
 
         self.last_results = results
         self._populate_tree(results)
 
-    def _populate_tree(self, items: Dict[str, Dict[str, Any]]) -> None:
-        self.tree.clear()
-        add_item = self.tree.addTopLevelItem
-        for det in items.values():
-            row = [str(det.get(col, "")) for col in self.columns]
-            add_item(QTreeWidgetItem(row))
+    def _cache_results(self, key: Tuple[str, str, str], names: List[str]) -> None:
+        """Keep ``names`` for ``key``, dropping the oldest entries beyond the cache limits."""
+        cache = self._search_cache
+        cache[key] = names
+        self._search_cache_names += len(names)
+        while len(cache) > SEARCH_CACHE_SIZE or self._search_cache_names > SEARCH_CACHE_NAMES:
+            _, old = cache.popitem(last=False)
+            self._search_cache_names -= len(old)
+
+    def _filter(self, q: str, tf: str, mf: str) -> Dict[str, ParamRecord]:
+        ql = q.lower()
+        results = self.param_dict
+        names = None
+        if self._last_q and ql.startswith(self._last_q) and (tf, mf) == (self._last_tf, self._last_mf):
+            # A longer query can only match a subset of the previous results
+            names = search_keys(self.last_results, q, self._search_index)
+        else:
+            if tf != "All" and mf != "All":
+                # Walk the smaller bucket; both keep load order
+                small, big = sorted((self._by_type.get(tf, {}), self._by_module.get(mf, {})), key=len)
+                names = [n for n in small if n in big]
+            elif tf != "All":
+                results = self._by_type.get(tf, {})
+            elif mf != "All":
+                results = self._by_module.get(mf, {})
+            if q:
+                names = search_keys(results if names is None else names, q, self._search_index)
+        if names is not None:
+            # Narrow on names only and build the result dict once
+            records = self.param_dict
+            results = {n: records[n] for n in names}
+        return results
+
+    def _populate_tree(self, items: Dict[str, ParamRecord]) -> None:
+        cache = self._row_cache
+        self.model.set_rows([cache[name] for name in items])
         self.lbl_count.setText(f"{len(items)} displayed")
 
     # ---------- Menus ----------
@@ -345,49 +692,50 @@ class A2LSearchWindow(QMainWindow):
         menu.exec(self.tree.header().mapToGlobal(pos))
 
     def _row_context_menu(self, pos: QPoint) -> None:
-        item = self.tree.itemAt(pos)
-        if not item:
+        index = self.tree.indexAt(pos)
+        if not index.isValid():
             return
         menu = QMenu(self)
         act_copy_cell = QAction("Copy Cell", self)
         act_copy_row = QAction("Copy Row (TSV)", self)
         act_export_sel = QAction("Export Selected...", self)
-        act_copy_cell.triggered.connect(lambda: self._copy_cell(item))
-        act_copy_row.triggered.connect(self._copy_row(item))
+        act_copy_cell.triggered.connect(lambda: self._copy_cell(index))
+        act_copy_row.triggered.connect(self._copy_row(index.row()))
         act_export_sel.triggered.connect(self._export_selected)
+        # One export at a time; _end_export would re-enable actions under a second one
+        act_export_sel.setEnabled(self._export_worker is None)
         menu.addAction(act_copy_cell)
         menu.addAction(act_copy_row)
         menu.addSeparator()
         menu.addAction(act_export_sel)
         menu.exec(self.tree.viewport().mapToGlobal(pos))
 
-    def _copy_cell(self, item: QTreeWidgetItem) -> None:
-        col = self.tree.currentColumn()
-        text = item.text(col)
+    def _copy_cell(self, index: QModelIndex) -> None:
+        text = self.model.data(index) or ""
         QGuiApplication.clipboard().setText(text, QClipboard.Clipboard)
         self.status.showMessage("Cell copied")
 
-    def _copy_row(self, item: QTreeWidgetItem):
+    def _copy_row(self, row: int):
         def _handler():
-            parts = [item.text(i) for i in range(self.tree.columnCount())]
+            parts = self.model.row_values(row)
             QGuiApplication.clipboard().setText("\t".join(parts), QClipboard.Clipboard)
             self.status.showMessage("Row copied")
         return _handler
 
     def _export_selected(self) -> None:
-        items = self.tree.selectedItems()
-        if not items:
+        if self._export_worker is not None:
+            return
+        # Ranges, not selectedRows(): after select-all that would build one index per row
+        selection = self.tree.selectionModel().selection()
+        selected = sorted({r for rng in selection for r in range(rng.top(), rng.bottom() + 1)})
+        if not selected:
             QMessageBox.information(self, "Export", "No rows selected.")
             return
-        path, _ = QFileDialog.getSaveFileName(self, "Save Selected Rows", "", "Excel Files (*.xlsx)")
+        path = self._ask_export_path("Save Selected Rows")
         if not path:
             return
-        try:
-            rows = [{self.columns[i]: it.text(i) for i in range(len(self.columns))} for it in items]
-            pd.DataFrame(rows).to_excel(path, index=False)
-            self.status.showMessage(f"Exported {len(rows)} selected rows to {path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", str(e))
+        rows = [self.model.row_values(r) for r in selected]
+        self._start_export(rows, path, self._selected_export_finished)
 
     # ---------- Misc ----------
     def file_label_text(self, text: str) -> None:
@@ -399,6 +747,10 @@ class A2LSearchWindow(QMainWindow):
 
     # ---------- Qt events ----------
     def closeEvent(self, event) -> None:
+        if self._load_thread is not None:
+            # The parse cannot be interrupted; let it end before the thread object goes away
+            self._load_thread.quit()
+            self._load_thread.wait()
         self._save_state()
         super().closeEvent(event)
 
@@ -1,10 +1,14 @@
 # main.py
 import sys
-from PySide6.QtWidgets import QApplication
-from gui import A2LSearchWindow
+import multiprocessing
 
 
 def main():
+    # Imported here, not at module level: worker processes that parse large files
+    # re-import this module and only need data_utils
+    from PySide6.QtWidgets import QApplication
+    from gui import A2LSearchWindow
+
     app = QApplication(sys.argv)
     window = A2LSearchWindow()
     window.show()
@@ -12,4 +16,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Large files are parsed in worker processes; needed for frozen Windows builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -17,11 +17,13 @@ def load_data(file_path):
     Only rows with Type 'Parameter' are processed.
     """
     df = pd.read_excel(file_path)
-    df['Address_Int'] = df['Address'].apply(hex_to_int)
+    # A plain comprehension skips Series.apply's per-row overhead
+    df['Address_Int'] = [hex_to_int(a) for a in df['Address'].tolist()]
     parameters = df[df['Type'] == 'Parameter']
     
     param_dict = {}
     for _, row in parameters.iterrows():
+        comment = row["Comment"] if isinstance(row["Comment"], str) else ""
         param_dict[row['Name']] = {
             "Comment": row["Comment"],
             "Address": row["Address"],
@@ -30,7 +32,9 @@ def load_data(file_path):
             "Phys_Unit": row["Phys. Unit"],
             "Standard_Min": row["Standard Min."],
             "Standard_Max": row["Standard Max."],
-            "Format": row["Format"]
+            "Format": row["Format"],
+            # Lower-cased once here so searching needs no per-entry .lower()
+            "_search_blob": (str(row['Name']) + "\x01" + comment).lower(),
         }
     return param_dict
 
@@ -39,12 +43,9 @@ def search_parameters(param_dict, query):
     Search for parameters where the query is found in the parameter name or comment.
     The search is case-insensitive.
     """
-    results = {}
     query_lower = query.lower()
-    for name, details in param_dict.items():
-        if query_lower in name.lower() or query_lower in details.get("Comment", "").lower():
-            results[name] = details
-    return results
+    return {name: details for name, details in param_dict.items()
+            if query_lower in details["_search_blob"]}
 
 class A2LSearchApp(tk.Tk):
     def __init__(self):